@@ -26,8 +26,10 @@ What it does (heuristics, not a full JS transpiler):
 - Writes a report of all replacements performed.
 
 Usage:
-  python mzifier.py INPUT.js [-o OUTPUT.js] [--inplace] [--no-color] [--keep-mv-color]
-  python mzifier.py --batch plugins/*.js
+  python mzifier.py INPUT.js [-o OUTPUT.js] [--inplace] [--no-color] [--keep-mv-color] [--cache]
+  python mzifier.py --batch plugins/*.js [--report-combined REPORT.txt]
+
+  Wildcards are expanded by MZifier itself, so they also work from cmd.exe.
 
 Notes:
 - This is deliberately conservative. It avoids touching uncertain code.
@@ -35,10 +37,33 @@ Notes:
 """
 
 import argparse
+import contextlib
+import functools
+import hashlib
+import json
+import multiprocessing
+import os
 import pathlib
 import re
 import sys
-from typing import List, Tuple
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+
+try:
+    import hyperscan
+except ImportError:  # Optional; find_phases falls back to substring checks.
+    hyperscan = None
+
+try:
+    import re2
+except ImportError:  # Optional; the pluginCommand scan falls back to `re`.
+    re2 = None
+
+# RE2 scans in linear time, which helps the pluginCommand search: it has few
+# matches and no \s. The color rewrite stays on `re`: RE2's per-match overhead
+# makes it slower there, and its \s does not match \v, which would change output.
+_scan_re = re2 if re2 is not None else re
 
 # --- Rules --------------------------------------------------------------------
 
@@ -61,46 +86,113 @@ WINDOW_BASE_TO_STATUSBASE_METHODS = [
     "placeGauge",
 ]
 
-# Color helper replacements (MV -> MZ ColorManager)
-COLOR_REPLACEMENTS = [
-    (r"\bthis\.systemColor\s*\(\s*\)", "ColorManager.systemColor()"),
-    (r"\bthis\.crisisColor\s*\(\s*\)", "ColorManager.crisisColor()"),
-    (r"\bthis\.deathColor\s*\(\s*\)", "ColorManager.deathColor()"),
-    (r"\bthis\.gaugeBackColor\s*\(\s*\)", "ColorManager.gaugeBackColor()"),
-    (r"\bthis\.hpColor\s*\(\s*(.*?)\s*\)", r"ColorManager.hpColor(\1)"),
-    (r"\bthis\.mpColor\s*\(\s*(.*?)\s*\)", r"ColorManager.mpColor(\1)"),
-    (r"\bthis\.tpColor\s*\(\s*(.*?)\s*\)", r"ColorManager.tpColor(\1)"),
-    (r"\bthis\.mpCostColor\s*\(\s*\)", "ColorManager.mpCostColor()"),
-    (r"\bthis\.powerUpColor\s*\(\s*\)", "ColorManager.powerUpColor()"),
-    (r"\bthis\.powerDownColor\s*\(\s*\)", "ColorManager.powerDownColor()"),
-    (r"\bthis\.paramchangeTextColor\s*\(\s*(.*?)\s*\)", r"ColorManager.paramchangeTextColor(\1)"),
-    (r"\bthis\.textColor\s*\(\s*(.*?)\s*\)", r"ColorManager.textColor(\1)"),
-    (r"\bthis\.normalColor\s*\(\s*\)", "ColorManager.normalColor()"),
-]
+# Color helper replacements (MV -> MZ ColorManager).
+# Maps each MV Window_Base color method to whether it takes an argument.
+COLOR_HELPERS = {
+    "systemColor": False,
+    "crisisColor": False,
+    "deathColor": False,
+    "gaugeBackColor": False,
+    "hpColor": True,
+    "mpColor": True,
+    "tpColor": True,
+    "mpCostColor": False,
+    "powerUpColor": False,
+    "powerDownColor": False,
+    "paramchangeTextColor": True,
+    "textColor": True,
+    "normalColor": False,
+}
+
+# All color helpers fused into one alternation so the source is scanned once.
+# Sources are handled as raw UTF-8 bytes. The rule literals are ASCII, but on
+# bytes \b, \w and \s are ASCII-only too, unlike the old str patterns:
+# non-ASCII letters don't count as word characters (so "éGame_Interpreter..."
+# now matches) and Unicode spaces such as U+00A0 aren't skipped inside
+# "this.hpColor(...)". Plugin code is ASCII in practice, so this is accepted.
+_COLOR_RE = re.compile((
+    r"\bthis\.(?:"
+    r"(?P<noarg>" + "|".join(n for n, takes_arg in COLOR_HELPERS.items() if not takes_arg) + r")\s*\(\s*\)"
+    r"|(?P<name>" + "|".join(n for n, takes_arg in COLOR_HELPERS.items() if takes_arg) + r")\s*\(\s*(?P<arg>.*?)\s*\)"
+    r")"
+).encode("ascii"))
 
 MV_PLUGIN_COMMAND_SIGNS = [
     # Common MV plugin command hooks we can't auto-convert to MZ registerCommand.
-    r"\bGame_Interpreter\.prototype\.pluginCommand\b",
+    rb"\bGame_Interpreter\.prototype\.pluginCommand\b",
 ]
 
-HEADER_BLOCK_RE = re.compile(r"/\*:[\s\S]*?\*/", re.MULTILINE)
-
-def add_target_mz(header: str) -> str:
+# Window_Base rewrites find the literal prefix with bytes.find and check the
+# following identifier against a set, so no regex runs on the common miss.
+_WB_PREFIX = b"Window_Base.prototype."
+_WB_METHODS = frozenset(m.encode("ascii") for m in WINDOW_BASE_TO_STATUSBASE_METHODS)
+# Only [A-Za-z0-9_], matching the old trailing \b: "drawActorName$x" still counts.
+_IDENT_RE = re.compile(rb"\w+")
+_WORD_BYTES = frozenset(b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_")
+
+# Compiled once at import so batch runs don't re-parse patterns per file.
+_PC_RE = _scan_re.compile(b"|".join(MV_PLUGIN_COMMAND_SIGNS))
+
+PLUGIN_COMMAND_TODO = (
+    b"\n// [MZ TODO] Detected MV-style pluginCommand. In MZ, migrate to:\n"
+    b"// PluginManager.registerCommand(pluginName, command, handler)\n"
+    b"// and use @command/@arg annotations in the header.\n"
+)
+
+HEADER_BLOCK_RE = re.compile(rb"/\*:[\s\S]*?\*/")
+# The opener including any locale tag, e.g. "/*:" or "/*:ja".
+_HEADER_OPENER_RE = re.compile(rb"/\*:\w*")
+
+# Optional Hyperscan prescreen: one multi-pattern scan reports which rewrite
+# phases have anything to do. The rewrites themselves stay on `re`, since
+# Hyperscan has no capture groups or lazy-match semantics.
+_PHASE_WINDOW_BASE, _PHASE_COLORS, _PHASE_PLUGIN_COMMAND = range(3)
+
+def _build_hyperscan_db():
+    if hyperscan is None:
+        return None
+    scans = [
+        (_PHASE_WINDOW_BASE, (
+            r"\bWindow_Base\.prototype\.(?:" + "|".join(WINDOW_BASE_TO_STATUSBASE_METHODS) + r")\b"
+        ).encode("ascii")),
+        (_PHASE_COLORS, (r"\bthis\.(?:" + "|".join(COLOR_HELPERS) + r")\s*\(").encode("ascii")),
+    ]
+    scans.extend((_PHASE_PLUGIN_COMMAND, sig) for sig in MV_PLUGIN_COMMAND_SIGNS)
+    db = hyperscan.Database()
+    db.compile(
+        expressions=[expr for _, expr in scans],
+        ids=[phase for phase, _ in scans],
+        elements=len(scans),
+        flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(scans),
+    )
+    return db
+
+_HYPERSCAN_DB = _build_hyperscan_db()
+
+# Without Hyperscan, the color phase is gated on its exact call literals;
+# "this." alone is in nearly every plugin.
+_COLOR_LITERALS = tuple(b"this." + name.encode("ascii") for name in COLOR_HELPERS)
+
+def add_target_mz(header: bytes) -> bytes:
     """Ensure @target MZ exists inside the header block."""
-    if "@target" in header:
+    if b"@target" in header:
         return header
     # Insert @target MZ after the opening /*: line
-    lines = header.splitlines()
-    if lines:
-        # Find index after first line
-        insert_at = 1 if len(lines) > 1 else 0
-        lines.insert(insert_at, " * @target MZ")
-        return "\n".join(lines)
-    return header
-
-def ensure_header_has_target_mz(source: str) -> Tuple[str, bool]:
+    nl = header.find(b"\n")
+    if nl < 0:
+        # Single-line header: break the line right after the opener, keeping
+        # a locale tag such as /*:ja attached to it.
+        end = _HEADER_OPENER_RE.match(header).end()
+        return header[:end] + b"\n * @target MZ\n" + header[end:]
+    # Bytes are written back untranslated, so keep the file's own line endings.
+    eol = b"\r\n" if header[nl - 1:nl] == b"\r" else b"\n"
+    return header[:nl + 1] + b" * @target MZ" + eol + header[nl + 1:]
+
+def ensure_header_has_target_mz(source: bytes) -> Tuple[bytes, bool]:
     """Add @target MZ to the first plugin header block if missing.
     Returns (new_source, changed?)."""
+    if b"/*:" not in source:
+        return source, False
     m = HEADER_BLOCK_RE.search(source)
     if not m:
         return source, False
@@ -111,135 +203,378 @@ def ensure_header_has_target_mz(source: str) -> Tuple[str, bool]:
         return source, True
     return source, False
 
-def replace_window_base_methods(source: str) -> Tuple[str, List[str]]:
+def replace_window_base_methods(source: bytes) -> Tuple[bytes, List[str]]:
     """Rewrite Window_Base.prototype.X to Window_StatusBase.prototype.X for known methods."""
-    changes = []
-    for method in WINDOW_BASE_TO_STATUSBASE_METHODS:
-        pattern = re.compile(
-            rf"\bWindow_Base\.prototype\.{re.escape(method)}\b"
-        )
-        if pattern.search(source):
-            source = pattern.sub(f"Window_StatusBase.prototype.{method}", source)
-            changes.append(f"Window_Base.prototype.{method} -> Window_StatusBase.prototype.{method}")
+    counts = Counter()
+    parts = []
+    last = 0
+    idx = source.find(_WB_PREFIX)
+    while idx >= 0:
+        end = idx + len(_WB_PREFIX)
+        ident = _IDENT_RE.match(source, end)
+        # Mirror the old \b anchor: skip e.g. MyWindow_Base.prototype.drawActorName.
+        if ident and ident.group() in _WB_METHODS and not (idx and source[idx - 1] in _WORD_BYTES):
+            parts.append(source[last:idx])
+            parts.append(b"Window_StatusBase.prototype.")
+            last = end
+            counts[ident.group().decode("ascii")] += 1
+        idx = source.find(_WB_PREFIX, end)
+    if parts:
+        parts.append(source[last:])
+        source = b"".join(parts)
+    changes = [
+        f"Window_Base.prototype.{method} -> Window_StatusBase.prototype.{method}"
+        for method in WINDOW_BASE_TO_STATUSBASE_METHODS
+        if counts[method]
+    ]
     return source, changes
 
 
-def replace_colors(source: str, keep_mv_color: bool) -> Tuple[str, List[str]]:
-    """Replace MV window color helpers with MZ ColorManager.* calls."""
+def replace_colors(source: bytes, keep_mv_color: bool) -> Tuple[bytes, "Counter[str]"]:
+    """Replace MV window color helpers with MZ ColorManager.* calls.
+    Returns (new_source, hits per helper name)."""
+    counts = Counter()
     if keep_mv_color:
+        return source, counts
+    return _rewrite_colors(source, counts), counts
+
+def _rewrite_colors(source: bytes, counts: "Counter[str]") -> bytes:
+    parts = []
+    last = 0
+    for m in _COLOR_RE.finditer(source):
+        parts.append(source[last:m.start()])
+        last = m.end()
+        noarg, name, arg = m.group("noarg", "name", "arg")
+        if noarg:
+            counts[noarg.decode("ascii")] += 1
+            parts.append(b"ColorManager." + noarg + b"()")
+            continue
+        counts[name.decode("ascii")] += 1
+        # The lazy argument stops at the first ")", so a nested call such as
+        # this.textColor(this.hpColor(a)) arrives here without its closing paren.
+        arg = _rewrite_colors(arg + b")", counts)[:-1]
+        parts.append(b"ColorManager." + name + b"(" + arg + b")")
+    if not parts:
+        return source
+    parts.append(source[last:])
+    return b"".join(parts)
+
+def annotate_plugin_command_todos(source: bytes) -> Tuple[bytes, List[str]]:
+    """Add a TODO comment where MV plugin command hooks are found."""
+    # Collect every insertion point in one pass, then build the output once.
+    starts = [m.start() for m in _PC_RE.finditer(source)]
+    if not starts:
         return source, []
-    changes = []
-    for pat, repl in COLOR_REPLACEMENTS:
-        new_source, n = re.subn(pat, repl, source)
-        if n > 0:
-            changes.append(f"{pat} -> {repl} ({n}x)")
-            source = new_source
-    return source, changes
+    # Only files that actually match pay for the line-ending check.
+    todo = PLUGIN_COMMAND_TODO
+    if b"\r\n" in source:
+        todo = todo.replace(b"\n", b"\r\n")
+    parts = []
+    last = 0
+    for start in starts:
+        parts.append(source[last:start])
+        parts.append(todo)
+        last = start
+    parts.append(source[last:])
+    return b"".join(parts), ["Annotated MV pluginCommand for manual conversion."]
+
+def find_phases(source: bytes) -> Tuple[bool, bool, bool]:
+    """Cheaply report which rewrite phases may apply.
+    Returns (has_window_base, has_colors, has_plugin_command)."""
+    if _HYPERSCAN_DB is None:
+        return (
+            b"Window_Base.prototype." in source,
+            any(literal in source for literal in _COLOR_LITERALS),
+            b"pluginCommand" in source,
+        )
+    found = set()
 
-def annotate_plugin_command_todos(source: str) -> Tuple[str, List[str]]:
-    """Add a TODO comment where MV plugin command hooks are found."""
-    changes = []
-    for sig in MV_PLUGIN_COMMAND_SIGNS:
-        pattern = re.compile(sig)
-        if pattern.search(source):
-            todo = ("\n// [MZ TODO] Detected MV-style pluginCommand. In MZ, migrate to:\n"
-                    "// PluginManager.registerCommand(pluginName, command, handler)\n"
-                    "// and use @command/@arg annotations in the header.\n")
-            source = pattern.sub(lambda m: todo + m.group(0), source)
-            changes.append("Annotated MV pluginCommand for manual conversion.")
-    return source, changes
+    def on_match(phase, start, end, flags, context):
+        found.add(phase)
+
+    _HYPERSCAN_DB.scan(source, match_event_handler=on_match)
+    return (
+        _PHASE_WINDOW_BASE in found,
+        _PHASE_COLORS in found,
+        _PHASE_PLUGIN_COMMAND in found,
+    )
 
 def guess_plugin_name_from_filename(path: pathlib.Path) -> str:
     return path.stem
 
-def convert_text(source: str, *, keep_mv_color: bool) -> Tuple[str, List[str]]:
+def convert_text(source: bytes, *, keep_mv_color: bool) -> Tuple[bytes, List[str]]:
     report = []
     # 1) Ensure @target MZ
     source, changed = ensure_header_has_target_mz(source)
     if changed:
         report.append("Added '@target MZ' to plugin header.")
 
+    # Prescreen so most plugins skip the regex phases entirely.
+    has_wb, has_colors, has_pc = find_phases(source)
+
     # 2) Replace Window_Base.* actor helpers to Window_StatusBase.*
-    source, changes = replace_window_base_methods(source)
-    report.extend(changes)
+    if has_wb:
+        source, changes = replace_window_base_methods(source)
+        report.extend(changes)
 
     # 3) Color helpers -> ColorManager
-    source, changes = replace_colors(source, keep_mv_color)
-    report.extend(changes)
+    if has_colors:
+        source, color_counts = replace_colors(source, keep_mv_color)
+        report.extend(
+            f"this.{name}(...) -> ColorManager.{name}(...) ({color_counts[name]}x)"
+            for name in COLOR_HELPERS
+            if color_counts[name]
+        )
 
     # 4) Leave TODO notes for MV plugin commands
-    source, changes = annotate_plugin_command_todos(source)
-    report.extend(changes)
+    if has_pc:
+        source, changes = annotate_plugin_command_todos(source)
+        report.extend(changes)
 
     return source, report
 
 
+# --- Conversion cache -----------------------------------------------------------
+
+# Opt-in (--cache): converted output + report keyed by a hash of the input, so
+# duplicate plugin copies (backup folders, repeat batch runs) skip the rewrite
+# passes. Nothing is evicted automatically; delete the folder to clear it.
+def _default_cache_dir() -> pathlib.Path:
+    if os.name == "nt":
+        base = os.environ.get("LOCALAPPDATA")
+        if base:
+            return pathlib.Path(base) / "MZifier" / "Cache"
+    else:
+        base = os.environ.get("XDG_CACHE_HOME")
+        if base:
+            return pathlib.Path(base) / "mzifier"
+    return pathlib.Path.home() / ".cache" / "mzifier"
+
+CACHE_DIR = _default_cache_dir()
+# Bump whenever the conversion output changes, so stale entries are not reused.
+# Only ever increase it: earlier builds may have written entries under any lower value.
+_CACHE_VERSION = b"5"
+
+def cache_key(source: bytes, *, keep_mv_color: bool) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    h.update(_CACHE_VERSION + (b":keep-mv-color:" if keep_mv_color else b":convert-color:"))
+    h.update(source)
+    return h.hexdigest()
+
+def load_cached(key: str) -> Optional[Tuple[bytes, List[str]]]:
+    """Return (converted, report) for a cached conversion, or None on a miss."""
+    try:
+        converted = (CACHE_DIR / f"{key}.out").read_bytes()
+        report = json.loads((CACHE_DIR / f"{key}.json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return converted, report
+
+def store_cached(key: str, converted: bytes, report: List[str]) -> None:
+    """Best effort: a cache that can't be written is silently skipped."""
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # The report goes last so its presence implies a complete entry.
+        for name, payload in ((f"{key}.out", converted),
+                              (f"{key}.json", json.dumps(report).encode("utf-8"))):
+            tmp = CACHE_DIR / f"{name}.{os.getpid()}.tmp"
+            tmp.write_bytes(payload)
+            os.replace(tmp, CACHE_DIR / name)
+    except OSError:
+        pass
+
+
+def expand_glob(pattern: str) -> List[str]:
+    """Expand a wildcard pattern in-process, since cmd.exe does not glob for us."""
+    path = pathlib.Path(pattern)
+    if path.is_absolute():
+        root, rel = pathlib.Path(path.anchor), str(path.relative_to(path.anchor))
+    else:
+        root, rel = pathlib.Path(), pattern
+    return sorted(str(p) for p in root.glob(rel))
+
+
+def write_file(path: pathlib.Path, data: bytes) -> None:
+    """Write pre-encoded bytes straight to a file descriptor, skipping the io stack."""
+    # O_BINARY matters on Windows, where the default fd mode translates newlines.
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(path, flags, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def render_report(in_name: str, out_name: str, report: List[str]) -> str:
+    lines = [f"Conversion report for {in_name} -> {out_name}"]
+    if report:
+        lines.extend(f"- {line}" for line in report)
+    else:
+        lines.append("No heuristic changes were necessary.")
+    return "\n".join(lines)
+
+
+def output_path_for(in_path: pathlib.Path, *, output: Optional[str], inplace: bool) -> pathlib.Path:
+    if inplace:
+        return in_path
+    if output:
+        return pathlib.Path(output)
+    return in_path.with_name(in_path.stem + "_MZ" + in_path.suffix)
+
+
+def _process_one(
+    input_path_str: str,
+    *,
+    output: Optional[str],
+    inplace: bool,
+    keep_mv_color: bool,
+    use_cache: bool,
+    write_report: bool,
+) -> Tuple[bool, Optional[pathlib.Path], List[str], List[str]]:
+    """Convert one input file and write its output and, if asked, its sidecar report.
+    Returns (ok, out_path, report, errors); out_path is None if nothing was written."""
+    errors = []
+    in_path = pathlib.Path(input_path_str)
+    try:
+        data = in_path.read_bytes()
+    except FileNotFoundError:
+        return False, None, [], [f"[!] Not found: {in_path}"]
+    except Exception as e:
+        return False, None, [], [f"[!] Failed to read {in_path}: {e}"]
+
+    key = cache_key(data, keep_mv_color=keep_mv_color) if use_cache else None
+    cached = load_cached(key) if key else None
+    if cached:
+        converted, report = cached
+    else:
+        converted, report = convert_text(
+            data,
+            keep_mv_color=keep_mv_color,
+            )
+        if key:
+            store_cached(key, converted, report)
+
+    out_path = output_path_for(in_path, output=output, inplace=inplace)
+
+    try:
+        write_file(out_path, converted)
+    except Exception as e:
+        return False, None, [], [f"[!] Failed to write {out_path}: {e}"]
+
+    if write_report:
+        report_path = out_path.with_suffix(out_path.suffix + ".report.txt")
+        try:
+            write_file(report_path, render_report(in_path.name, out_path.name, report).encode("utf-8"))
+        except Exception as e:
+            errors.append(f"[!] Failed to write report {report_path}: {e}")
+
+    return True, out_path, report, errors
+
+
 def main(argv: List[str]) -> int:
     parser = argparse.ArgumentParser(description="Convert RPG Maker MV plugins to MZ (heuristic).")
-    parser.add_argument("inputs", nargs="+", help="Input MV plugin .js file(s).")
+    # Positional inputs and --batch share one list so files are processed in
+    # command-line order, even when a shell has already expanded the pattern.
+    parser.add_argument("inputs", nargs="*", action="extend", default=[],
+                        help="Input MV plugin .js file(s); wildcards are expanded.")
+    parser.add_argument("--batch", dest="inputs", nargs="+", action="extend", metavar="PATTERN",
+                        help="Convert every file matching PATTERN, e.g. 'plugins/*.js'. May be repeated.")
     parser.add_argument("-o", "--output", help="Output file (only valid with a single input).")
     parser.add_argument("--inplace", action="store_true", help="Overwrite inputs in place.")
     parser.add_argument("--keep-mv-color", action="store_true", help="Do not convert MV color helpers to ColorManager.")
+    parser.add_argument("--report-combined", metavar="PATH",
+                        help="Write one report covering all inputs to PATH instead of a sidecar per file.")
+    parser.add_argument("--cache", action="store_true",
+                        help=f"Reuse earlier conversions of identical files, stored in {CACHE_DIR}.")
     args = parser.parse_args(argv)
 
-    if args.output and len(args.inputs) != 1:
-        print("Error: --output is only valid with a single input file.", file=sys.stderr)
-        return 2
+    if not args.inputs:
+        parser.error("no input files given")
 
     overall_ok = True
 
-    for input_path_str in args.inputs:
-        in_path = pathlib.Path(input_path_str)
-        if not in_path.exists():
-            print(f"[!] Not found: {in_path}", file=sys.stderr)
-            overall_ok = False
+    inputs = []
+    for pattern in args.inputs:
+        # POSIX shells have already globbed, so a name like "B[1].js" that
+        # exists is a real file, not a pattern.
+        if not any(c in pattern for c in "*?[") or pathlib.Path(pattern).exists():
+            inputs.append(pattern)
             continue
-
-        try:
-            text = in_path.read_text(encoding="utf-8")
-        except Exception as e:
-            print(f"[!] Failed to read {in_path}: {e}", file=sys.stderr)
+        matches = expand_glob(pattern)
+        if not matches:
+            print(f"[!] No files match: {pattern}", file=sys.stderr)
             overall_ok = False
-            continue
+        inputs.extend(matches)
 
-        converted, report = convert_text(
-            text,
-            keep_mv_color=args.keep_mv_color,
-            )
+    if args.output and len(inputs) != 1:
+        print("Error: --output is only valid with a single input file.", file=sys.stderr)
+        return 2
 
-        if args.inplace:
-            out_path = in_path
-        elif args.output:
-            out_path = pathlib.Path(args.output)
+    worker = functools.partial(
+        _process_one,
+        output=args.output,
+        inplace=args.inplace,
+        keep_mv_color=args.keep_mv_color,
+        use_cache=args.cache,
+        write_report=not args.report_combined,
+    )
+    # Each plugin converts independently, so batches fan out across cores.
+    # Stay serial when workers could touch the same file: an input listed
+    # twice, or one input's output being another input (e.g. a stale X_MZ.js
+    # picked up next to X.js), which would make the result timing-dependent.
+    in_paths = [pathlib.Path(p).resolve() for p in inputs]
+    out_paths = [
+        output_path_for(p, output=args.output, inplace=args.inplace).resolve()
+        for p in in_paths
+    ]
+    in_set = set(in_paths)
+    parallel = (
+        len(inputs) > 1
+        and len(in_set) == len(in_paths)
+        and len(set(out_paths)) == len(out_paths)
+        and all(out == src or out not in in_set for src, out in zip(in_paths, out_paths))
+    )
+
+    combined = []
+
+    with contextlib.ExitStack() as stack:
+        if parallel:
+            executor = stack.enter_context(ProcessPoolExecutor())
+            results = executor.map(worker, inputs)
         else:
-            out_path = in_path.with_name(in_path.stem + "_MZ" + in_path.suffix)
-
-        try:
-            out_path.write_text(converted, encoding="utf-8")
-        except Exception as e:
-            print(f"[!] Failed to write {out_path}: {e}", file=sys.stderr)
-            overall_ok = False
-            continue
-
-        # Write a sidecar report
-        report_path = out_path.with_suffix(out_path.suffix + ".report.txt")
-        report_text = f"Conversion report for {in_path.name} -> {out_path.name}\n" + \
-                      "\n".join(f"- {line}" for line in report) if report else \
-                      "No heuristic changes were necessary."
+            results = map(worker, inputs)
+
+        for input_path_str, (ok, out_path, report, errors) in zip(inputs, results):
+            for error in errors:
+                print(error, file=sys.stderr)
+            if not ok:
+                overall_ok = False
+                continue
+            if args.report_combined:
+                combined.append(render_report(input_path_str, str(out_path), report))
+
+            print(f"[OK] Wrote {out_path}")
+            if report:
+                print("  Changes:")
+                for line in report:
+                    print(f"   - {line}")
+            else:
+                print("  No heuristic changes were necessary.")
+
+    if args.report_combined:
+        # One large buffered write instead of an open/close per input.
+        report_path = pathlib.Path(args.report_combined)
         try:
-            report_path.write_text(report_text, encoding="utf-8")
+            with open(report_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+                f.writelines(f"{text}\n\n" for text in combined)
         except Exception as e:
             print(f"[!] Failed to write report {report_path}: {e}", file=sys.stderr)
 
-        print(f"[OK] Wrote {out_path}")
-        if report:
-            print("  Changes:")
-            for line in report:
-                print(f"   - {line}")
-        else:
-            print("  No heuristic changes were necessary.")
-
     return 0 if overall_ok else 1
 
 if __name__ == "__main__":
+    # Needed for the process pool in the frozen Windows executable.
+    multiprocessing.freeze_support()
     raise SystemExit(main(sys.argv[1:]))